@@ -0,0 +1,853 @@
+# -*- coding: utf-8 -*-
+"""Performance benchmarks for pybaselines.
+
+Times every public method of :class:`Baseline` and :class:`Baseline2D` over a grid of data
+sizes, along with several internal hot paths, and writes the results to a JSON file. Two
+result files can then be compared to find performance regressions.
+
+Example usage, ran from the main pybaselines directory::
+
+    python tools/benchmark.py run --output main.json
+    python tools/benchmark.py run --output branch.json --no-numba --no-pentapy
+    python tools/benchmark.py compare main.json branch.json
+
+The time to import pybaselines from a new interpreter can be measured, and optionally
+checked against a limit or a list of modules that should not be loaded, with::
+
+    python tools/benchmark.py import-time --max-time 0.5 --forbid numba pentapy
+
+Methods are timed in two modes: ``single``, in which a new fitting object is created for
+each call so that all setup is included in the timing, and ``reused``, in which the same
+fitting object is called repeatedly after an initial untimed call, so that only the per-call
+cost is measured.
+
+The ``--aspls-warm-start`` option additionally times :meth:`Baseline.aspls` when each call is
+warm started from the previous call's output parameters, and the functional
+:func:`whittaker.aspls` interface, as was done by the previous ``benchmark_aspls.py`` script::
+
+    python tools/benchmark.py run --methods aspls --skip-2d --skip-kernels --aspls-warm-start
+
+Created on October 17, 2026
+
+"""
+
+import argparse
+from datetime import datetime, timezone
+from functools import partial
+import json
+import platform
+import subprocess
+import sys
+import time
+
+
+# methods that are not baseline fitting methods and should be ignored
+_IGNORED_ATTRIBUTES = ('banded_solver', 'pentapy_solver', 'get_method')
+# methods whose input data must have an extra leading dimension
+_DATASET_METHODS = ('collab_pls',)
+_DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+_DEFAULT_SIZES_2D = ((100, 100), (500, 500), (1000, 1000), (2000, 2000))
+_IMPORT_STATEMENTS = (
+    'import amcg_pybaselines',
+    'from amcg_pybaselines import Baseline',
+    'from amcg_pybaselines import Baseline2D',
+)
+# optional or slow to import dependencies whose loading is reported by the import benchmark
+_HEAVY_MODULES = ('numba', 'pentapy', 'scipy.sparse', 'scipy.signal', 'scipy.ndimage')
+# ran in a new interpreter so that nothing is cached from previous imports
+_IMPORT_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{'time': elapsed, 'modules': [m for m in {modules!r} if m in sys.modules]}}))
+'''
+
+
+def _block_import(module_name):
+    """
+    Prevents a module from being imported.
+
+    Setting the module's entry in `sys.modules` to None causes any subsequent import of
+    the module to raise an ImportError, so pybaselines behaves as if the module is not
+    installed.
+
+    Parameters
+    ----------
+    module_name : str
+        The name of the module to block.
+
+    Raises
+    ------
+    RuntimeError
+        Raised if the module was already imported.
+
+    """
+    if sys.modules.get(module_name) is not None:
+        raise RuntimeError(f'{module_name} was already imported and cannot be blocked')
+    sys.modules[module_name] = None
+
+
+def get_public_methods(klass):
+    """
+    Gets all public baseline methods from a class.
+
+    Parameters
+    ----------
+    klass : type
+        The class to use.
+
+    Returns
+    -------
+    list[str]
+        The sorted names of all public baseline methods of the class.
+
+    """
+    return sorted(
+        method for method in dir(klass)
+        if not method.startswith('_') and not method.startswith(_IGNORED_ATTRIBUTES)
+        and callable(getattr(klass, method))
+    )
+
+
+def make_data(num_points, seed=0):
+    """
+    Creates a noisy signal with several peaks and a curved baseline.
+
+    Parameters
+    ----------
+    num_points : int
+        The number of data points.
+    seed : int, optional
+        The seed for the random number generator. Default is 0.
+
+    Returns
+    -------
+    x : numpy.ndarray, shape (N,)
+        The x-values.
+    y : numpy.ndarray, shape (N,)
+        The y-values.
+
+    """
+    import numpy as np
+    from amcg_pybaselines.utils import gaussian
+
+    x = np.linspace(0, 1000, num_points)
+    signal = (
+        gaussian(x, 5, 150, 8)
+        + gaussian(x, 8, 400, 15)
+        + gaussian(x, 4, 620, 5)
+        + gaussian(x, 6, 850, 25)
+    )
+    baseline = 5 + 2e-3 * x + gaussian(x, 3, 600, 250)
+    noise = np.random.default_rng(seed).normal(0, 0.1, num_points)
+
+    return x, signal + baseline + noise
+
+
+def make_data2d(shape, seed=0):
+    """
+    Creates a noisy two dimensional signal with several peaks and a curved baseline.
+
+    Parameters
+    ----------
+    shape : tuple(int, int)
+        The number of rows and columns of the data.
+    seed : int, optional
+        The seed for the random number generator. Default is 0.
+
+    Returns
+    -------
+    x : numpy.ndarray, shape (M,)
+        The x-values.
+    z : numpy.ndarray, shape (N,)
+        The z-values.
+    y : numpy.ndarray, shape (M, N)
+        The y-values.
+
+    """
+    import numpy as np
+    from amcg_pybaselines.utils import gaussian2d
+
+    x = np.linspace(0, 1000, shape[0])
+    z = np.linspace(0, 1000, shape[1])
+    X, Z = np.meshgrid(x, z, indexing='ij')
+    signal = (
+        gaussian2d(X, Z, 5, 200, 300, 15, 20)
+        + gaussian2d(X, Z, 8, 500, 700, 25, 10)
+        + gaussian2d(X, Z, 4, 800, 200, 10, 30)
+    )
+    baseline = 5 + 2e-3 * X + 1e-3 * Z
+    noise = np.random.default_rng(seed).normal(0, 0.1, shape)
+
+    return x, z, signal + baseline + noise
+
+
+def _method_inputs(method, x, y, two_d=False):
+    """
+    Creates the data and keyword arguments needed to call a method.
+
+    Parameters
+    ----------
+    method : str
+        The name of the method.
+    x : numpy.ndarray
+        The x-values for one dimensional data; not used for two dimensional data.
+    y : numpy.ndarray
+        The y-values.
+    two_d : bool, optional
+        Whether the data is two dimensional. Default is False.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        The data to pass to the method.
+    kwargs : dict
+        Any additional keyword arguments required by the method.
+
+    """
+    import numpy as np
+
+    kwargs = {}
+    if method in _DATASET_METHODS:
+        rng = np.random.default_rng(1)
+        data = np.array([y + rng.normal(0, 0.1, y.shape) for _ in range(5)])
+    else:
+        data = y
+    if method == 'interp_pts' and not two_d:
+        indices = np.linspace(0, len(x) - 1, 20, dtype=np.intp)
+        kwargs['baseline_points'] = np.column_stack((x[indices], y[indices]))
+
+    return data, kwargs
+
+
+def _time_calls(func, repeat):
+    """
+    Times repeated calls of a function.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to time; takes no arguments.
+    repeat : int
+        The number of times to call the function.
+
+    Returns
+    -------
+    list[float]
+        The wall time, in seconds, of each call.
+
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _positive_int(value):
+    """Converts a string to an integer and ensures it is greater than zero."""
+    try:
+        output = int(value)
+    except ValueError:
+        output = 0
+    if output < 1:
+        raise argparse.ArgumentTypeError(f'must be a positive integer, not {value}')
+    return output
+
+
+def _ratio_threshold(value):
+    """Converts a string to a float and ensures it is a finite value greater than one."""
+    try:
+        output = float(value)
+    except ValueError:
+        output = 0
+    if not 1 < output < float('inf'):
+        raise argparse.ArgumentTypeError(f'must be a number greater than 1, not {value}')
+    return output
+
+
+def _record_failure(failures, name, error):
+    """Prints and records an exception raised while running a benchmark."""
+    message = f'{type(error).__name__}: {error}'
+    print(f': failed with {message}')
+    failures[name] = message
+
+
+def _new_fitter_call(fitter_class, init_args, method, data, kwargs):
+    """Creates a new fitting object and calls the method so setup costs are included."""
+    return getattr(fitter_class(*init_args), method)(data, **kwargs)
+
+
+def _summarize(times):
+    """Creates the statistics for a set of timings."""
+    ordered = sorted(times)
+    count = len(ordered)
+    middle = count // 2
+    if count % 2:
+        median = ordered[middle]
+    else:
+        median = 0.5 * (ordered[middle - 1] + ordered[middle])
+    return {
+        'min': ordered[0],
+        'median': median,
+        'mean': sum(ordered) / count,
+        'max': ordered[-1],
+        'repeat': count,
+    }
+
+
+def _benchmark_methods(fitter_class, methods, size_grid, make_inputs, repeat, max_time, label,
+                       results, failures):
+    """
+    Times a set of methods over a grid of data sizes.
+
+    Sizes are timed in increasing order and, once the fastest call of a method using a new
+    fitting object exceeds `max_time` seconds, larger sizes are skipped for that method.
+
+    Parameters
+    ----------
+    fitter_class : type
+        The fitting class, either Baseline or Baseline2D.
+    methods : Sequence[str]
+        The names of the methods to time.
+    size_grid : Sequence
+        The data sizes to use.
+    make_inputs : Callable
+        A function that takes a size and returns the args used to initialize `fitter_class`
+        and the y-values.
+    repeat : int
+        The number of timed calls for each method, size, and mode.
+    max_time : float
+        The maximum time, in seconds, for the fastest call before larger sizes are skipped.
+    label : str
+        The label used when creating the keys for `results`.
+    results : dict
+        The dictionary in which to place the results. Modified inplace.
+    failures : dict
+        The dictionary in which to place the error messages for any benchmarks that raised
+        an exception. Modified inplace. Larger sizes are skipped for a method once it fails.
+
+    """
+    two_d = fitter_class.__name__ == 'Baseline2D'
+    inputs = {}
+    for method in methods:
+        for size in size_grid:
+            if size not in inputs:
+                inputs[size] = make_inputs(size)
+            init_args, y = inputs[size]
+            data, kwargs = _method_inputs(method, init_args[0], y, two_d)
+            size_label = 'x'.join(str(val) for val in size) if isinstance(size, tuple) else size
+            print(f'{label}.{method} (size={size_label})', end='', flush=True)
+
+            try:
+                # the initial call of the reused fitter is untimed to exclude setup costs
+                # and one-time compilation
+                fitter = fitter_class(*init_args)
+                getattr(fitter, method)(data, **kwargs)
+
+                reused = _time_calls(partial(getattr(fitter, method), data, **kwargs), repeat)
+                single = _time_calls(
+                    partial(_new_fitter_call, fitter_class, init_args, method, data, kwargs),
+                    repeat
+                )
+            except Exception as e:
+                _record_failure(failures, f'{label}.{method}[size={size_label}]', e)
+                break
+
+            for mode, times in (('single', single), ('reused', reused)):
+                results[f'{label}.{method}[size={size_label},mode={mode}]'] = _summarize(times)
+            print(f': {min(reused):.4g} s')
+            if min(single) > max_time:
+                print(f'  skipping larger sizes for {label}.{method}')
+                break
+
+
+def _benchmark_aspls_warm_start(size_grid, repeat, max_time, results, failures):
+    """
+    Times warm started aspls fits and the functional aspls interface.
+
+    For the warm started fits, each timed call is given the parameter dictionary output by
+    the previous call, as is done when fitting a series of similar spectra.
+
+    Parameters
+    ----------
+    size_grid : Sequence[int]
+        The data sizes to use.
+    repeat : int
+        The number of timed calls for each size and mode.
+    max_time : float
+        The maximum time, in seconds, for the fastest call before larger sizes are skipped.
+    results : dict
+        The dictionary in which to place the results. Modified inplace. The number of
+        iterations of the last call is also added for each result.
+    failures : dict
+        The dictionary in which to place the error messages for any benchmarks that raised
+        an exception. Modified inplace. Larger sizes are skipped once a failure occurs.
+
+    """
+    from amcg_pybaselines import Baseline, whittaker
+
+    for size in size_grid:
+        x, y = make_data(size)
+        print(f'aspls warm start (size={size})', end='', flush=True)
+
+        try:
+            fitter = Baseline(x)
+            params = fitter.aspls(y)[1]  # untimed initial call to exclude setup costs
+            cold_iterations = len(params['tol_history'])
+            warm_times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                params = fitter.aspls(y, warm_start=params)[1]
+                warm_times.append(time.perf_counter() - start)
+
+            function_times = _time_calls(partial(whittaker.aspls, y, x_data=x), repeat)
+        except Exception as e:
+            _record_failure(failures, f'aspls_warm_start[size={size}]', e)
+            break
+
+        results[f'Baseline.aspls[size={size},mode=warm_start]'] = {
+            **_summarize(warm_times), 'iterations': len(params['tol_history'])
+        }
+        results[f'whittaker.aspls[size={size},mode=function]'] = {
+            **_summarize(function_times), 'iterations': cold_iterations
+        }
+        print(
+            f': warm start {min(warm_times):.4g} s ({len(params["tol_history"])} iterations), '
+            f'function {min(function_times):.4g} s ({cold_iterations} iterations)'
+        )
+        if min(function_times) > max_time:
+            print('  skipping larger sizes for aspls warm start')
+            break
+
+
+def _penalized_solve(system, y, weights):
+    """Adds the weights to the penalty and solves, as done each iteration of Whittaker methods."""
+    lhs = system.penalty.copy()
+    lhs[system.main_diagonal_index] += weights
+    return system.solve(lhs, weights * y)
+
+
+def _benchmark_kernels(size_grid, repeat, results, failures):
+    """
+    Times several internal functions that are hot paths for many methods.
+
+    Parameters
+    ----------
+    size_grid : Sequence[int]
+        The data sizes to use.
+    repeat : int
+        The number of timed calls for each function and size.
+    results : dict
+        The dictionary in which to place the results. Modified inplace.
+    failures : dict
+        The dictionary in which to place the error messages for any benchmarks that raised
+        an exception. Modified inplace.
+
+    """
+    import numpy as np
+    from amcg_pybaselines import _banded_utils, _spline_utils, _weighting
+
+    for size in size_grid:
+        x, y = make_data(size)
+        print(f'kernels (size={size})', end='', flush=True)
+        try:
+            # these are private functions, so their signatures may change
+            baseline = np.linspace(y.min(), np.median(y), size)
+            weights = _weighting._asls(y, baseline, 1e-2)
+            system = _banded_utils.PenalizedSystem(size, lam=1e5, diff_order=2)
+            knots = _spline_utils._spline_knots(x, 100, 3, True)
+        except Exception as e:
+            _record_failure(failures, f'kernel.setup[size={size}]', e)
+            continue
+        print()
+
+        kernels = {
+            'diff_penalty_diagonals': partial(_banded_utils.diff_penalty_diagonals, size, 2),
+            'PenalizedSystem.solve': partial(_penalized_solve, system, y, weights),
+            '_spline_basis': partial(_spline_utils._spline_basis, x, knots, 3),
+            '_weighting._asls': partial(_weighting._asls, y, baseline, 1e-2),
+            '_weighting._arpls': partial(_weighting._arpls, y, baseline),
+        }
+        for name, func in kernels.items():
+            key = f'kernel.{name}[size={size}]'
+            try:
+                func()  # initial call to trigger any compilation
+                times = _time_calls(func, repeat)
+            except Exception as e:
+                print(f'{key}', end='')
+                _record_failure(failures, key, e)
+            else:
+                results[key] = _summarize(times)
+
+
+def _metadata(numba_blocked, pentapy_blocked):
+    """Collects information about the environment in which the benchmarks ran."""
+    import numpy as np
+    import scipy
+
+    import amcg_pybaselines
+    from amcg_pybaselines import _compat
+
+    return {
+        'pybaselines': amcg_pybaselines.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'numba': not numba_blocked and _compat._HAS_NUMBA,
+        'pentapy': not pentapy_blocked and _compat._HAS_PENTAPY,
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    }
+
+
+def run(args):
+    """
+    Runs the benchmarks and writes the results to a JSON file.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The parsed command line arguments.
+
+    Returns
+    -------
+    int
+        The exit code: 2 if any input methods are unknown, 1 if any benchmark raised an
+        exception, otherwise 0.
+
+    """
+    # must block optional dependencies before pybaselines is first imported
+    if args.no_numba:
+        _block_import('numba')
+    if args.no_pentapy:
+        _block_import('pentapy')
+
+    from amcg_pybaselines import Baseline, Baseline2D
+
+    if args.methods:
+        unknown = [
+            method for method in args.methods
+            if method not in get_public_methods(Baseline)
+            and method not in get_public_methods(Baseline2D)
+        ]
+        if unknown:
+            print(
+                f'error: unknown methods {", ".join(unknown)}; not a public method of '
+                'Baseline or Baseline2D', file=sys.stderr
+            )
+            return 2
+
+    results = {}
+    failures = {}
+    try:
+        _run_benchmarks(args, Baseline, Baseline2D, results, failures)
+    finally:
+        # always write the results so that any completed benchmarks are kept
+        output = {
+            'metadata': _metadata(args.no_numba, args.no_pentapy),
+            'results': results,
+            'failures': failures,
+        }
+        with open(args.output, 'w') as file:
+            json.dump(output, file, indent=2)
+        print(f'\nWrote {len(results)} results to {args.output}')
+
+    if failures:
+        print(f'{len(failures)} benchmarks failed:')
+        for name, message in failures.items():
+            print(f'  {name}: {message}')
+        return 1
+    return 0
+
+
+def _run_benchmarks(args, Baseline, Baseline2D, results, failures):
+    """
+    Runs the benchmarks selected by the command line arguments.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The parsed command line arguments.
+    Baseline : type
+        The Baseline class.
+    Baseline2D : type
+        The Baseline2D class.
+    results : dict
+        The dictionary in which to place the results. Modified inplace.
+    failures : dict
+        The dictionary in which to place the error messages for any benchmarks that raised
+        an exception. Modified inplace.
+
+    """
+    if not args.skip_1d:
+        methods = args.methods or get_public_methods(Baseline)
+
+        def make_inputs(size):
+            x, y = make_data(size)
+            return (x,), y
+
+        _benchmark_methods(
+            Baseline, [m for m in methods if hasattr(Baseline, m)], args.sizes, make_inputs,
+            args.repeat, args.max_time, 'Baseline', results, failures
+        )
+    if not args.skip_2d:
+        methods = args.methods or get_public_methods(Baseline2D)
+
+        def make_inputs_2d(shape):
+            x, z, y = make_data2d(shape)
+            return (x, z), y
+
+        _benchmark_methods(
+            Baseline2D, [m for m in methods if hasattr(Baseline2D, m)], args.sizes_2d,
+            make_inputs_2d, args.repeat, args.max_time, 'Baseline2D', results, failures
+        )
+    if args.aspls_warm_start:
+        _benchmark_aspls_warm_start(args.sizes, args.repeat, args.max_time, results, failures)
+    if not args.skip_kernels:
+        _benchmark_kernels(args.sizes, args.repeat, results, failures)
+
+
+def _time_import(statement, modules):
+    """
+    Times an import statement within a new Python interpreter.
+
+    Parameters
+    ----------
+    statement : str
+        The import statement to time.
+    modules : Sequence[str]
+        The names of modules to check for after the import.
+
+    Returns
+    -------
+    elapsed : float
+        The time, in seconds, to run the import statement.
+    loaded : list[str]
+        The names within `modules` that were imported by the statement.
+
+    Raises
+    ------
+    RuntimeError
+        Raised if the import failed.
+
+    """
+    process = subprocess.run(
+        [sys.executable, '-c', _IMPORT_SCRIPT.format(statement=statement, modules=modules)],
+        capture_output=True, text=True, check=False
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f'running "{statement}" failed:\n{process.stderr}')
+    output = json.loads(process.stdout.strip().splitlines()[-1])
+    return output['time'], output['modules']
+
+
+def import_time(args):
+    """
+    Times importing pybaselines from a cold interpreter and writes the results to a JSON file.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The parsed command line arguments.
+
+    Returns
+    -------
+    int
+        The exit code: 1 if any import took longer than `args.max_time` or loaded any of
+        the modules in `args.forbid`, otherwise 0.
+
+    """
+    results = {}
+    failed = False
+    for statement in _IMPORT_STATEMENTS:
+        times = []
+        loaded = []
+        for _ in range(args.repeat):
+            elapsed, loaded_modules = _time_import(
+                statement, _HEAVY_MODULES + tuple(args.forbid)
+            )
+            times.append(elapsed)
+            # use all modules loaded by any run in case the loading is not deterministic
+            loaded.extend(module for module in loaded_modules if module not in loaded)
+        results[f'import[{statement}]'] = _summarize(times)
+        print(f'{statement}: {min(times):.4g} s; loaded {", ".join(loaded) or "no heavy modules"}')
+
+        forbidden = [module for module in args.forbid if module in loaded]
+        if forbidden:
+            print(f'  FAILED: imported {", ".join(forbidden)}')
+            failed = True
+        if args.max_time is not None and min(times) > args.max_time:
+            print(f'  FAILED: took longer than {args.max_time} s')
+            failed = True
+
+    output = {
+        'metadata': _metadata(False, False),
+        'results': results,
+    }
+    with open(args.output, 'w') as file:
+        json.dump(output, file, indent=2)
+    print(f'\nWrote {len(results)} results to {args.output}')
+
+    return int(failed)
+
+
+def compare(args):
+    """
+    Compares two benchmark result files.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The parsed command line arguments.
+
+    Returns
+    -------
+    int
+        The exit code: 1 if any benchmarks were slower or were in the reference file but
+        missing from the contender file, otherwise 0.
+
+    """
+    with open(args.reference) as file:
+        reference = json.load(file)
+    with open(args.contender) as file:
+        contender = json.load(file)
+
+    rows = []
+    missing = []
+    zero_reference = []
+    for key, ref_stats in reference['results'].items():
+        if key not in contender['results']:
+            missing.append(key)
+            continue
+        elif ref_stats[args.statistic] <= 0:
+            zero_reference.append(key)
+            continue
+        ratio = contender['results'][key][args.statistic] / ref_stats[args.statistic]
+        if ratio > args.threshold:
+            status = 'slower'
+        elif ratio < 1 / args.threshold:
+            status = 'faster'
+        elif args.only_changed:
+            continue
+        else:
+            status = ''
+        rows.append((
+            ratio, key, ref_stats[args.statistic], contender['results'][key][args.statistic],
+            status
+        ))
+    rows.sort(reverse=True)
+
+    for name in ('pybaselines', 'numba', 'pentapy'):
+        print(f'{name}: {reference["metadata"].get(name)} -> {contender["metadata"].get(name)}')
+    print(f'\n{"Benchmark":<70} {"Reference (s)":>14} {"Contender (s)":>14} {"Ratio":>7}')
+    print('-' * 108)
+    for ratio, key, ref_time, new_time, status in rows:
+        print(f'{key:<70} {ref_time:>14.4g} {new_time:>14.4g} {ratio:>7.2f} {status}'.rstrip())
+
+    if zero_reference:
+        print(
+            f'\n{len(zero_reference)} benchmarks had a reference time of zero and were not '
+            'compared:'
+        )
+        for key in zero_reference:
+            print(f'  {key}')
+    added = set(contender['results']).difference(reference['results'])
+    if added:
+        print(f'\n{len(added)} benchmarks were only in the contender file and were not compared')
+    if missing:
+        print(f'\n{len(missing)} benchmarks were missing from the contender file:')
+        for key in missing:
+            print(f'  {key}')
+        for name, message in contender.get('failures', {}).items():
+            print(f'  failure in {name}: {message}')
+    num_slower = sum(row[-1] == 'slower' for row in rows)
+    print(f'\n{num_slower} benchmarks were slower by more than a factor of {args.threshold}')
+
+    return int(num_slower > 0 or len(missing) > 0)
+
+
+def _parse_shape(value):
+    """Converts a string like '500x400' to a tuple of integers."""
+    try:
+        shape = tuple(int(val) for val in value.lower().split('x'))
+    except ValueError:
+        shape = ()
+    if len(shape) != 2:
+        raise argparse.ArgumentTypeError(f'shape must be like 500x400, not {value}')
+    return shape
+
+
+def main(argv=None):
+    """Parses command line arguments and runs the selected command."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('--output', '-o', default='benchmarks.json', help='the output file')
+    run_parser.add_argument(
+        '--methods', nargs='+', help='the methods to time; default is all public methods'
+    )
+    run_parser.add_argument('--sizes', nargs='+', type=_positive_int, default=_DEFAULT_SIZES)
+    run_parser.add_argument(
+        '--sizes-2d', nargs='+', type=_parse_shape, default=_DEFAULT_SIZES_2D,
+        help='the 2D data shapes, written like 500x400'
+    )
+    run_parser.add_argument('--repeat', '-r', type=_positive_int, default=5)
+    run_parser.add_argument(
+        '--max-time', type=float, default=10,
+        help='skip larger sizes of a method once its fastest call is slower than this (seconds)'
+    )
+    run_parser.add_argument('--no-numba', action='store_true', help='run as if numba is missing')
+    run_parser.add_argument(
+        '--no-pentapy', action='store_true', help='run as if pentapy is missing'
+    )
+    run_parser.add_argument('--skip-1d', action='store_true')
+    run_parser.add_argument('--skip-2d', action='store_true')
+    run_parser.add_argument('--skip-kernels', action='store_true')
+    run_parser.add_argument(
+        '--aspls-warm-start', action='store_true',
+        help='also time warm started aspls fits and the functional aspls interface'
+    )
+    run_parser.set_defaults(func=run)
+
+    import_parser = subparsers.add_parser(
+        'import-time', help='time importing pybaselines in new interpreters'
+    )
+    import_parser.add_argument('--output', '-o', default='import_time.json', help='the output file')
+    import_parser.add_argument('--repeat', '-r', type=_positive_int, default=10)
+    import_parser.add_argument(
+        '--max-time', type=float, help='fail if the fastest import is slower than this (seconds)'
+    )
+    import_parser.add_argument(
+        '--forbid', nargs='+', default=[], metavar='MODULE',
+        help='fail if any of these modules are loaded by the import, eg. numba scipy.sparse'
+    )
+    import_parser.set_defaults(func=import_time)
+
+    compare_parser = subparsers.add_parser('compare', help='compare two result files')
+    compare_parser.add_argument('reference', help='the reference result file')
+    compare_parser.add_argument('contender', help='the result file to compare to the reference')
+    compare_parser.add_argument(
+        '--threshold', type=_ratio_threshold, default=1.1,
+        help='the time ratio, greater than 1, above which a benchmark counts as slower'
+    )
+    compare_parser.add_argument(
+        '--statistic', choices=('min', 'median', 'mean', 'max'), default='min'
+    )
+    compare_parser.add_argument(
+        '--only-changed', action='store_true', help='only show slower or faster benchmarks'
+    )
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+
+    sys.exit(main())
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""Tests for the pure Python parts of tools/benchmark.py.
+
+These do not require pybaselines to be installed, so that the regression check done by the
+compare command can be tested anywhere.
+
+Created on October 17, 2026
+
+"""
+
+import argparse
+import json
+import sys
+import types
+
+import pytest
+
+import benchmark
+
+
+def write_results(path, results, **metadata):
+    """Writes a result file in the format output by the benchmark commands."""
+    path.write_text(json.dumps({'metadata': metadata, 'results': results}))
+    return str(path)
+
+
+@pytest.fixture
+def result_files(tmp_path):
+    """Creates reference and contender files with one slower, faster, and unchanged result."""
+    reference = write_results(
+        tmp_path / 'reference.json',
+        {
+            'slower': {'min': 1.0, 'median': 1.0},
+            'faster': {'min': 1.0, 'median': 1.0},
+            'same': {'min': 1.0, 'median': 1.0},
+        },
+        numba=True
+    )
+    contender = write_results(
+        tmp_path / 'contender.json',
+        {
+            'slower': {'min': 1.5, 'median': 1.0},
+            'faster': {'min': 0.5, 'median': 1.0},
+            'same': {'min': 1.05, 'median': 1.0},
+            'only_contender': {'min': 1.0, 'median': 1.0},
+        },
+        numba=False
+    )
+    return reference, contender
+
+
+@pytest.mark.parametrize(
+    'times, expected_median', (([3.0], 3.0), ([3.0, 1.0, 2.0], 2.0), ([4.0, 1.0, 2.0, 3.0], 2.5))
+)
+def test_summarize(times, expected_median):
+    """Ensures the summary statistics are correct for odd and even numbers of times."""
+    output = benchmark._summarize(times)
+
+    assert output['min'] == min(times)
+    assert output['max'] == max(times)
+    assert output['median'] == expected_median
+    assert output['mean'] == pytest.approx(sum(times) / len(times))
+    assert output['repeat'] == len(times)
+
+
+@pytest.mark.parametrize('value, expected', (('500x400', (500, 400)), ('10X20', (10, 20))))
+def test_parse_shape(value, expected):
+    """Ensures valid shapes are parsed."""
+    assert benchmark._parse_shape(value) == expected
+
+
+@pytest.mark.parametrize('value', ('500', '500x400x3', 'ax400', ''))
+def test_parse_shape_fails(value):
+    """Ensures invalid shapes raise an error."""
+    with pytest.raises(argparse.ArgumentTypeError):
+        benchmark._parse_shape(value)
+
+
+@pytest.mark.parametrize('value', ('0', '-1', '1.5', 'a'))
+def test_positive_int_fails(value):
+    """Ensures only positive integers are allowed."""
+    with pytest.raises(argparse.ArgumentTypeError):
+        benchmark._positive_int(value)
+
+
+@pytest.mark.parametrize('value', ('1', '0.9', '0', '-2', 'inf', 'nan', 'a'))
+def test_ratio_threshold_fails(value):
+    """Ensures the comparison threshold must be a finite number greater than 1."""
+    with pytest.raises(argparse.ArgumentTypeError):
+        benchmark._ratio_threshold(value)
+
+
+@pytest.mark.parametrize('command', ('run', 'import-time'))
+def test_zero_repeat_fails(command):
+    """Ensures repeat must be positive for commands that time calls."""
+    with pytest.raises(SystemExit):
+        benchmark.main([command, '--repeat', '0'])
+
+
+@pytest.mark.parametrize('size', ('0', '-10'))
+def test_nonpositive_size_fails(size):
+    """Ensures data sizes must be positive."""
+    with pytest.raises(SystemExit):
+        benchmark.main(['run', '--sizes', size])
+
+
+def test_compare_threshold_below_one_fails(result_files):
+    """Ensures a threshold that would reverse the comparison is not allowed."""
+    with pytest.raises(SystemExit):
+        benchmark.main(['compare', *result_files, '--threshold', '0.9'])
+
+
+def test_compare_finds_regression(result_files, capsys):
+    """Ensures compare exits with 1 and marks results slower than the threshold."""
+    assert benchmark.main(['compare', *result_files]) == 1
+
+    output = capsys.readouterr().out
+    assert 'numba: True -> False' in output
+    assert '1 benchmarks were only in the contender file' in output
+    lines = {line.split()[0]: line for line in output.splitlines() if line.strip()}
+    assert lines['slower'].endswith('slower')
+    assert lines['faster'].endswith('faster')
+    assert lines['same'].endswith('1.05')
+    assert 'only_contender' not in lines
+
+
+def test_compare_missing_from_contender(tmp_path, capsys):
+    """Ensures a benchmark in the reference but not the contender counts as a regression."""
+    reference = write_results(
+        tmp_path / 'reference.json', {'a': {'min': 1.0}, 'only_reference': {'min': 1.0}}
+    )
+    contender = tmp_path / 'contender.json'
+    contender.write_text(json.dumps({
+        'metadata': {},
+        'results': {'a': {'min': 1.0}},
+        'failures': {'only_reference': 'ValueError: bad input'},
+    }))
+    assert benchmark.main(['compare', reference, str(contender)]) == 1
+
+    output = capsys.readouterr().out
+    assert '1 benchmarks were missing from the contender file' in output
+    assert '  only_reference' in output
+    assert 'failure in only_reference: ValueError: bad input' in output
+
+
+def test_compare_zero_reference(tmp_path, capsys):
+    """Ensures a reference time of zero is reported rather than raising an error."""
+    reference = write_results(tmp_path / 'reference.json', {'a': {'min': 0.0}, 'b': {'min': 1.0}})
+    contender = write_results(tmp_path / 'contender.json', {'a': {'min': 1.0}, 'b': {'min': 1.0}})
+    assert benchmark.main(['compare', reference, contender]) == 0
+
+    output = capsys.readouterr().out
+    assert '1 benchmarks had a reference time of zero' in output
+
+
+def test_compare_threshold(result_files):
+    """Ensures results within the threshold are not regressions."""
+    assert benchmark.main(['compare', *result_files, '--threshold', '2']) == 0
+
+
+def test_compare_statistic(result_files):
+    """Ensures the chosen statistic is used for the comparison."""
+    assert benchmark.main(['compare', *result_files, '--statistic', 'median']) == 0
+
+
+def test_compare_only_changed(result_files, capsys):
+    """Ensures unchanged results can be hidden."""
+    benchmark.main(['compare', *result_files, '--only-changed'])
+
+    output = capsys.readouterr().out
+    lines = {line.split()[0] for line in output.splitlines() if line.strip()}
+    assert 'same' not in lines
+    assert {'slower', 'faster'}.issubset(lines)
+
+
+def test_compare_no_regression(tmp_path):
+    """Ensures comparing a file to itself is not a regression."""
+    reference = write_results(tmp_path / 'reference.json', {'a': {'min': 1.0}})
+    assert benchmark.main(['compare', reference, reference]) == 0
+
+
+def test_import_time_uses_all_runs(tmp_path, monkeypatch):
+    """Ensures modules loaded by any of the repeated imports are checked by --forbid."""
+    calls = []
+
+    def fake_time_import(statement, modules):
+        calls.append(statement)
+        # only load numba on the first run of each statement
+        return 0.1, ['numba'] if len(calls) % 3 == 1 else []
+
+    monkeypatch.setattr(benchmark, '_time_import', fake_time_import)
+    monkeypatch.setattr(benchmark, '_metadata', lambda *args: {})
+    output = tmp_path / 'import_time.json'
+    exit_code = benchmark.main([
+        'import-time', '--repeat', '3', '--forbid', 'numba', '--output', str(output)
+    ])
+
+    assert exit_code == 1
+    assert len(calls) == 3 * len(benchmark._IMPORT_STATEMENTS)
+    results = json.loads(output.read_text())['results']
+    assert all(result['repeat'] == 3 for result in results.values())
+
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    """Replaces pybaselines and the benchmarks so that run can be tested without them."""
+    fake_module = types.ModuleType('amcg_pybaselines')
+    fake_module.Baseline = type('Baseline', (), {})
+    fake_module.Baseline2D = type('Baseline2D', (), {})
+    monkeypatch.setitem(sys.modules, 'amcg_pybaselines', fake_module)
+    monkeypatch.setattr(benchmark, '_metadata', lambda *args: {})
+
+    def set_benchmarks(func):
+        monkeypatch.setattr(benchmark, '_run_benchmarks', func)
+
+    return set_benchmarks
+
+
+def test_run_failures_exit_code(tmp_path, fake_run):
+    """Ensures run exits with 1 and records failures when a benchmark raises an exception."""
+    def run_benchmarks(args, Baseline, Baseline2D, results, failures):
+        results['a'] = {'min': 1.0}
+        failures['b'] = 'ValueError: bad input'
+
+    fake_run(run_benchmarks)
+    output = tmp_path / 'benchmarks.json'
+    assert benchmark.main(['run', '--output', str(output)]) == 1
+
+    saved = json.loads(output.read_text())
+    assert saved['results'] == {'a': {'min': 1.0}}
+    assert saved['failures'] == {'b': 'ValueError: bad input'}
+
+
+def test_run_writes_partial_results(tmp_path, fake_run):
+    """Ensures completed results are written even if the benchmarks stop with an error."""
+    def run_benchmarks(args, Baseline, Baseline2D, results, failures):
+        results['a'] = {'min': 1.0}
+        raise KeyboardInterrupt
+
+    fake_run(run_benchmarks)
+    output = tmp_path / 'benchmarks.json'
+    with pytest.raises(KeyboardInterrupt):
+        benchmark.main(['run', '--output', str(output)])
+
+    assert json.loads(output.read_text())['results'] == {'a': {'min': 1.0}}